@@ -6,12 +6,21 @@ Created according to PRD specifications with hybrid translation system
 import streamlit as st
 import json
 import datetime
+import heapq
+import io
+import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from collections import Counter
+from operator import attrgetter
+from types import SimpleNamespace
+from dataclasses import dataclass
 from enum import Enum
 import uuid
 import os
 from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +34,51 @@ except ImportError:
     OPENAI_AVAILABLE = False
     st.warning("OpenAI library not installed. Using mock translations.")
 
+# orjson serializes several times faster than stdlib json; fall back
+# quietly when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson lets large imports stream-parse instead of loading the whole
+# document into memory first
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Imports above this size take the streaming parse path
+_IMPORT_STREAM_THRESHOLD = 1 << 20  # 1 MB
+
+# Styling injected once per rerun; built at import time so run() only ships
+# the finished string
+_CSS = """
+<style>
+.stApp {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+.task-card {
+    border: 1px solid #e0e0e0;
+    border-radius: 10px;
+    padding: 1rem;
+    margin: 0.5rem 0;
+    background-color: #fafafa;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.metric-card {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 8px;
+    text-align: center;
+}
+</style>
+"""
+
+
 class Priority(Enum):
     LOW = "🟢 Low"
     MEDIUM = "🟡 Medium" 
@@ -35,7 +89,73 @@ class Status(Enum):
     IN_PROGRESS = "⏳ In Progress"
     COMPLETED = "✅ Completed"
 
-@dataclass
+# Widget option lists rebuilt on every rerun otherwise; compute them once
+PRIORITY_VALUES = tuple(p.value for p in Priority)
+STATUS_VALUES = tuple(s.value for s in Status)
+# Bare bindings for the hot loops and renderers; Enum.MEMBER.value is a
+# descriptor call each time it appears
+_STATUS_TODO = Status.TODO.value
+_STATUS_IN_PROGRESS = Status.IN_PROGRESS.value
+_STATUS_COMPLETED = Status.COMPLETED.value
+_PRIORITY_HIGH = Priority.HIGH.value
+_PRIORITY_MEDIUM = Priority.MEDIUM.value
+_PRIORITY_LOW = Priority.LOW.value
+# O(1) value -> selectbox-index map; list.index() was a linear scan per card
+STATUS_INDEX = {value: i for i, value in enumerate(STATUS_VALUES)}
+
+# Packed display-order sort key: status ordinal in the high bits, priority
+# rank in the low two. Todo -> In Progress -> Completed, High -> Medium -> Low
+_TASK_SORT_KEY = {
+    (status, priority): (status_rank << 2) | priority_rank
+    for status_rank, status in enumerate(STATUS_VALUES)
+    for priority_rank, priority in enumerate(
+        (_PRIORITY_HIGH, _PRIORITY_MEDIUM, _PRIORITY_LOW))
+}
+
+# Single-pass dictionary-key normalizer table (space -> underscore,
+# punctuation stripped)
+_NORMALIZE_TABLE = str.maketrans({' ': '_', '.': '', ',': '', '!': '', '?': ''})
+
+# Demo payload for the sidebar 'Add Sample Tasks' button; immutable so each
+# click just iterates it (tags are tuples, converted per created task)
+_SAMPLE_TASKS = (
+    {
+        'title': 'Buy groceries',
+        'description': 'Get milk, bread, eggs and vegetables from the supermarket',
+        'priority': Priority.MEDIUM.value,
+        'tags': ('shopping', 'food', 'weekly')
+    },
+    {
+        'title': 'Finish project report',
+        'description': 'Complete the quarterly project analysis and submit to manager',
+        'priority': Priority.HIGH.value,
+        'tags': ('work', 'deadline', 'important')
+    },
+    {
+        'title': 'Call doctor for appointment',
+        'description': 'Schedule annual health checkup with family doctor',
+        'priority': Priority.LOW.value,
+        'tags': ('health', 'appointment', 'personal')
+    },
+    {
+        'title': 'Pay monthly bills',
+        'description': 'Pay electricity, water, internet and phone bills before due date',
+        'priority': Priority.MEDIUM.value,
+        'tags': ('finance', 'bills', 'monthly')
+    },
+    {
+        'title': 'Exercise routine',
+        'description': '30 minutes cardio workout at home or gym',
+        'priority': Priority.LOW.value,
+        'tags': ('health', 'fitness', 'daily')
+    }
+)
+
+# Unicode script prefixes that pin text to one supported language; Latin
+# scripts are shared between five of the six languages, so they stay out
+_LANGUAGE_SCRIPTS = {'Hindi': 'DEVANAGARI'}
+
+@dataclass(slots=True)
 class Task:
     id: str
     title: str
@@ -52,12 +172,408 @@ class Task:
         if self.translations is None:
             self.translations = {}
 
+    def to_dict(self) -> Dict:
+        """Shallow dict view for serialization; tags and translations are
+        shared references, not copies, so callers must not mutate them
+        """
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'priority': self.priority,
+            'status': self.status,
+            'created_at': self.created_at,
+            'tags': self.tags,
+            'translations': self.translations,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'Task':
+        """Build a Task from an imported/exported dict, defaulting the
+        optional fields in one place
+        """
+        return cls(
+            id=d.get('id') or str(uuid.uuid4()),
+            title=d['title'],
+            description=d['description'],
+            priority=d['priority'],
+            status=d['status'],
+            created_at=d['created_at'],
+            tags=d.get('tags') or [],
+            translations=d.get('translations') or {},
+        )
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_translate(_app, text: str, target_language: str, context: str) -> tuple:
+    """Process-wide translation cache shared across sessions (24h TTL)
+    Dictionary first, then GPT; the leading-underscore app argument is
+    excluded from the cache key. Only called with a live client, and GPT
+    errors propagate uncached, so mock strings and failed attempts never
+    get served to other sessions.
+    """
+    dict_translation = _app.translate_text_with_dictionary(text, target_language)
+    if dict_translation and dict_translation != text:
+        return dict_translation, 'dictionary'
+    return _app.translate_text_with_gpt(text, target_language), 'gpt'
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _aggregate_task_stats(session_token: str, tasks_version: int, _tasks: List["Task"]) -> SimpleNamespace:
+    """Stats pass memoized on the session token plus task-list version; the
+    unhashable task list itself is excluded from the cache key, and the
+    token keeps per-session versions from colliding across sessions.
+    Every task mutation mints a new key, so cap the entry count instead
+    of letting stale versions pile up for the life of the process.
+    """
+    status_counts = Counter()
+    priority_counts = Counter()
+    tag_counts = Counter()
+    translated = 0
+    for task in _tasks:
+        status_counts[task.status] += 1
+        priority_counts[task.priority] += 1
+        tag_counts.update(task.tags)
+        if task.translations:
+            translated += 1
+    return SimpleNamespace(
+        total=len(_tasks),
+        status=status_counts,
+        priority=priority_counts,
+        tags=tag_counts,
+        translated=translated
+    )
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _export_tasks_json_cached(session_token: str, tasks_version: int, _tasks: List["Task"]) -> str:
+    """JSON export memoized on the session token plus task-list version,
+    so one session's export is never served to another; max_entries keeps
+    superseded versions from retaining full task payloads indefinitely
+    Task.to_dict is shallow, so no per-task deep copy of the nested
+    translations dicts; the serializer only reads them
+    """
+    tasks_data = [task.to_dict() for task in _tasks]
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(tasks_data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(tasks_data, indent=2, ensure_ascii=False)
+
+# Predefined translation tables and their derived lookup structures are
+# plain module constants: Python parses the literal once per process and
+# interns the strings, so nothing here is rebuilt per session or rerun
+_PREDEFINED_TRANSLATIONS = {
+    # UI Elements
+    'ui': {
+        'English': {
+            'app_title': 'AI Todo App',
+            'app_subtitle': 'Intelligent Multilingual Task Management',
+            'add_task': 'Add New Task',
+            'task_title': 'Task Title',
+            'task_description': 'Task Description', 
+            'priority': 'Priority',
+            'status': 'Status',
+            'tags': 'Tags (comma-separated)',
+            'create_task': 'Create Task',
+            'update_task': 'Update Task',
+            'delete_task': 'Delete Task',
+            'translate': 'Translate',
+            'language': 'Language',
+            'filter_by_status': 'Filter by Status',
+            'filter_by_priority': 'Filter by Priority',
+            'search_tasks': 'Search Tasks',
+            'no_tasks_found': 'No tasks found. Create your first task!',
+            'translation_cached': 'Translation cached',
+            'translation_from_gpt': 'Translated with AI',
+            'translation_from_dict': 'Quick translation',
+            'api_error': 'Translation service unavailable',
+            'all': 'All'
+        },
+        'Spanish': {
+            'app_title': 'App de Tareas IA',
+            'app_subtitle': 'Gestión Inteligente de Tareas Multiidioma',
+            'add_task': 'Agregar Nueva Tarea',
+            'task_title': 'Título de la Tarea',
+            'task_description': 'Descripción de la Tarea',
+            'priority': 'Prioridad',
+            'status': 'Estado',
+            'tags': 'Etiquetas (separadas por comas)',
+            'create_task': 'Crear Tarea',
+            'update_task': 'Actualizar Tarea',
+            'delete_task': 'Eliminar Tarea',
+            'translate': 'Traducir',
+            'language': 'Idioma',
+            'filter_by_status': 'Filtrar por Estado',
+            'filter_by_priority': 'Filtrar por Prioridad',
+            'search_tasks': 'Buscar Tareas',
+            'no_tasks_found': '¡No se encontraron tareas. Crea tu primera tarea!',
+            'translation_cached': 'Traducción almacenada',
+            'translation_from_gpt': 'Traducido con IA',
+            'translation_from_dict': 'Traducción rápida',
+            'api_error': 'Servicio de traducción no disponible',
+            'all': 'Todos'
+        },
+        'French': {
+            'app_title': 'App Todo IA',
+            'app_subtitle': 'Gestion Intelligente de Tâches Multilingue',
+            'add_task': 'Ajouter Nouvelle Tâche',
+            'task_title': 'Titre de la Tâche',
+            'task_description': 'Description de la Tâche',
+            'priority': 'Priorité',
+            'status': 'Statut',
+            'tags': 'Étiquettes (séparées par virgules)',
+            'create_task': 'Créer Tâche',
+            'update_task': 'Mettre à Jour Tâche',
+            'delete_task': 'Supprimer Tâche',
+            'translate': 'Traduire',
+            'language': 'Langue',
+            'filter_by_status': 'Filtrer par Statut',
+            'filter_by_priority': 'Filtrer par Priorité',
+            'search_tasks': 'Rechercher Tâches',
+            'no_tasks_found': 'Aucune tâche trouvée. Créez votre première tâche!',
+            'translation_cached': 'Traduction mise en cache',
+            'translation_from_gpt': 'Traduit avec IA',
+            'translation_from_dict': 'Traduction rapide',
+            'api_error': 'Service de traduction indisponible',
+            'all': 'Tous'
+        },
+        'German': {
+            'app_title': 'KI Todo App',
+            'app_subtitle': 'Intelligente Mehrsprachige Aufgabenverwaltung',
+            'add_task': 'Neue Aufgabe Hinzufügen',
+            'task_title': 'Aufgabentitel',
+            'task_description': 'Aufgabenbeschreibung',
+            'priority': 'Priorität',
+            'status': 'Status',
+            'tags': 'Tags (durch Kommas getrennt)',
+            'create_task': 'Aufgabe Erstellen',
+            'update_task': 'Aufgabe Aktualisieren',
+            'delete_task': 'Aufgabe Löschen',
+            'translate': 'Übersetzen',
+            'language': 'Sprache',
+            'filter_by_status': 'Nach Status Filtern',
+            'filter_by_priority': 'Nach Priorität Filtern',
+            'search_tasks': 'Aufgaben Suchen',
+            'no_tasks_found': 'Keine Aufgaben gefunden. Erstellen Sie Ihre erste Aufgabe!',
+            'translation_cached': 'Übersetzung zwischengespeichert',
+            'translation_from_gpt': 'Mit KI übersetzt',
+            'translation_from_dict': 'Schnellübersetzung',
+            'api_error': 'Übersetzungsdienst nicht verfügbar',
+            'all': 'Alle'
+        },
+        'Italian': {
+            'app_title': 'App Todo IA',
+            'app_subtitle': 'Gestione Intelligente Attività Multilingue',
+            'add_task': 'Aggiungi Nuova Attività',
+            'task_title': 'Titolo Attività',
+            'task_description': 'Descrizione Attività',
+            'priority': 'Priorità',
+            'status': 'Stato',
+            'tags': 'Tag (separati da virgole)',
+            'create_task': 'Crea Attività',
+            'update_task': 'Aggiorna Attività',
+            'delete_task': 'Elimina Attività',
+            'translate': 'Traduci',
+            'language': 'Lingua',
+            'filter_by_status': 'Filtra per Stato',
+            'filter_by_priority': 'Filtra per Priorità',
+            'search_tasks': 'Cerca Attività',
+            'no_tasks_found': 'Nessuna attività trovata. Crea la tua prima attività!',
+            'translation_cached': 'Traduzione memorizzata',
+            'translation_from_gpt': 'Tradotto con IA',
+            'translation_from_dict': 'Traduzione veloce',
+            'api_error': 'Servizio di traduzione non disponibile',
+            'all': 'Tutti'
+        },
+        'Hindi': {
+            'app_title': 'एआई टूडू ऐप',
+            'app_subtitle': 'बुद्धिमान बहुभाषी कार्य प्रबंधन',
+            'add_task': 'नया कार्य जोड़ें',
+            'task_title': 'कार्य शीर्षक',
+            'task_description': 'कार्य विवरण',
+            'priority': 'प्राथमिकता',
+            'status': 'स्थिति',
+            'tags': 'टैग (कॉमा से अलग करें)',
+            'create_task': 'कार्य बनाएं',
+            'update_task': 'कार्य अपडेट करें',
+            'delete_task': 'कार्य हटाएं',
+            'translate': 'अनुवाद करें',
+            'language': 'भाषा',
+            'filter_by_status': 'स्थिति के अनुसार फ़िल्टर करें',
+            'filter_by_priority': 'प्राथमिकता के अनुसार फ़िल्टर करें',
+            'search_tasks': 'कार्य खोजें',
+            'no_tasks_found': 'कोई कार्य नहीं मिला। अपना पहला कार्य बनाएं!',
+            'translation_cached': 'अनुवाद संग्रहीत',
+            'translation_from_gpt': 'एआई से अनुवादित',
+            'translation_from_dict': 'त्वरित अनुवाद',
+            'api_error': 'अनुवाद सेवा उपलब्ध नहीं',
+            'all': 'सभी'
+        }
+    },
+    # Common task phrases
+    'tasks': {
+        'English': {
+            'buy_groceries': 'Buy groceries',
+            'call_doctor': 'Call doctor',
+            'finish_project': 'Finish project',
+            'pay_bills': 'Pay bills',
+            'clean_house': 'Clean house',
+            'exercise': 'Exercise',
+            'study': 'Study',
+            'meeting': 'Meeting',
+            'deadline': 'Deadline',
+            'urgent': 'Urgent',
+            'important': 'Important',
+            'work': 'Work',
+            'personal': 'Personal',
+            'health': 'Health',
+            'finance': 'Finance',
+            'shopping': 'Shopping',
+            'appointment': 'Appointment'
+        },
+        'Spanish': {
+            'buy_groceries': 'Comprar comestibles',
+            'call_doctor': 'Llamar al doctor',
+            'finish_project': 'Terminar proyecto',
+            'pay_bills': 'Pagar facturas',
+            'clean_house': 'Limpiar casa',
+            'exercise': 'Hacer ejercicio',
+            'study': 'Estudiar',
+            'meeting': 'Reunión',
+            'deadline': 'Fecha límite',
+            'urgent': 'Urgente',
+            'important': 'Importante',
+            'work': 'Trabajo',
+            'personal': 'Personal',
+            'health': 'Salud',
+            'finance': 'Finanzas',
+            'shopping': 'Compras',
+            'appointment': 'Cita'
+        },
+        'French': {
+            'buy_groceries': 'Acheter des courses',
+            'call_doctor': 'Appeler le docteur',
+            'finish_project': 'Terminer le projet',
+            'pay_bills': 'Payer les factures',
+            'clean_house': 'Nettoyer la maison',
+            'exercise': 'Faire de l\'exercice',
+            'study': 'Étudier',
+            'meeting': 'Réunion',
+            'deadline': 'Date limite',
+            'urgent': 'Urgent',
+            'important': 'Important',
+            'work': 'Travail',
+            'personal': 'Personnel',
+            'health': 'Santé',
+            'finance': 'Finance',
+            'shopping': 'Achats',
+            'appointment': 'Rendez-vous'
+        },
+        'German': {
+            'buy_groceries': 'Lebensmittel kaufen',
+            'call_doctor': 'Arzt anrufen',
+            'finish_project': 'Projekt beenden',
+            'pay_bills': 'Rechnungen bezahlen',
+            'clean_house': 'Haus putzen',
+            'exercise': 'Sport treiben',
+            'study': 'Lernen',
+            'meeting': 'Besprechung',
+            'deadline': 'Frist',
+            'urgent': 'Dringend',
+            'important': 'Wichtig',
+            'work': 'Arbeit',
+            'personal': 'Persönlich',
+            'health': 'Gesundheit',
+            'finance': 'Finanzen',
+            'shopping': 'Einkaufen',
+            'appointment': 'Termin'
+        },
+        'Italian': {
+            'buy_groceries': 'Comprare generi alimentari',
+            'call_doctor': 'Chiamare il dottore',
+            'finish_project': 'Finire il progetto',
+            'pay_bills': 'Pagare le bollette',
+            'clean_house': 'Pulire casa',
+            'exercise': 'Fare esercizio',
+            'study': 'Studiare',
+            'meeting': 'Riunione',
+            'deadline': 'Scadenza',
+            'urgent': 'Urgente',
+            'important': 'Importante',
+            'work': 'Lavoro',
+            'personal': 'Personale',
+            'health': 'Salute',
+            'finance': 'Finanza',
+            'shopping': 'Shopping',
+            'appointment': 'Appuntamento'
+        },
+        'Hindi': {
+            'buy_groceries': 'किराना खरीदना',
+            'call_doctor': 'डॉक्टर को कॉल करना',
+            'finish_project': 'प्रोजेक्ट पूरा करना',
+            'pay_bills': 'बिल भुगतान',
+            'clean_house': 'घर साफ करना',
+            'exercise': 'व्यायाम',
+            'study': 'अध्ययन',
+            'meeting': 'बैठक',
+            'deadline': 'समय सीमा',
+            'urgent': 'तत्काल',
+            'important': 'महत्वपूर्ण',
+            'work': 'काम',
+            'personal': 'व्यक्तिगत',
+            'health': 'स्वास्थ्य',
+            'finance': 'वित्त',
+            'shopping': 'खरीदारी',
+            'appointment': 'अपॉइंटमेंट'
+        }
+    }
+}
+
+_SUPPORTED_LANGUAGES = ['English', 'Spanish', 'French', 'German', 'Italian', 'Hindi']
+
+# Precomputed lookup structures so the common dictionary hit is a hash
+# lookup; only a miss falls back to scanning the task phrases for a
+# partial match. Substring containment has no first-character (or any
+# prefix) structure to index - "doctor" must match "call_doctor" - so
+# the partial pass stays a linear scan over the ~17 phrases per language
+_NORMALIZED_LOOKUP: Dict[str, Dict[str, str]] = {}
+_PARTIAL_ITEMS: Dict[str, tuple] = {}
+for language in _SUPPORTED_LANGUAGES:
+    _NORMALIZED_LOOKUP[language] = {
+        **_PREDEFINED_TRANSLATIONS['tasks'].get(language, {}),
+        **_PREDEFINED_TRANSLATIONS['ui'].get(language, {})
+    }
+    _PARTIAL_ITEMS[language] = tuple(
+        _PREDEFINED_TRANSLATIONS['tasks'].get(language, {}).items()
+    )
+
+# Flat (language, key) -> label map; get_ui_text runs on every widget
+# label per rerun, so keep it to a single dict probe
+_UI_FLAT: Dict[tuple, str] = {
+    (language, key): value
+    for language, labels in _PREDEFINED_TRANSLATIONS['ui'].items()
+    for key, value in labels.items()
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key: str) -> Optional["OpenAI"]:
+    """One OpenAI client per key, shared across sessions and reruns
+    Keeps the client's HTTP connection pool alive instead of re-opening
+    it on every interaction. No test call here: a models.list() probe
+    added a round-trip to every first paint, and the key gets validated
+    on the first real translation anyway.
+    """
+    try:
+        return OpenAI(api_key=api_key)
+    except Exception as e:
+        st.error(f"OpenAI client initialization failed: {str(e)}")
+        return None
+
 class AITodoApp:
     def __init__(self):
         """Initialize the AI Todo App"""
         self.init_session_state()
         self.setup_predefined_translations()
         self.setup_openai_client()
+        # Dedup of identical translate requests within a single rerun
+        self._request_local_cache: Dict[tuple, tuple] = {}
         
     def init_session_state(self):
         """Initialize Streamlit session state"""
@@ -69,299 +585,42 @@ class AITodoApp:
             st.session_state.translation_cache = {}
         if 'api_usage_count' not in st.session_state:
             st.session_state.api_usage_count = 0
+        if 'pending_batches' not in st.session_state:
+            st.session_state.pending_batches = []
+        if 'task_cols' not in st.session_state:
+            # Columnar mirror of the task list (pre-lowercased search text,
+            # status, priority) so filtering avoids per-task attribute walks
+            st.session_state.task_cols = {'id': [], 'search': [], 'status': [], 'priority': []}
+        if 'task_index' not in st.session_state:
+            # id -> list index map so edits and deletes avoid O(n) scans
+            st.session_state.task_index = {}
+        if 'tasks_version' not in st.session_state:
+            # Bumped on every task mutation; lets filtering skip recomputation
+            # on reruns where nothing relevant changed
+            st.session_state.tasks_version = 0
+        if 'session_token' not in st.session_state:
+            # st.cache_data is process-wide; this token keys the cached
+            # stats/export helpers so sessions never see each other's data
+            st.session_state.session_token = uuid.uuid4().hex
             
     def setup_predefined_translations(self):
-        """Setup predefined translation dictionary for 5 languages"""
-        self.predefined_translations = {
-            # UI Elements
-            'ui': {
-                'English': {
-                    'app_title': 'AI Todo App',
-                    'app_subtitle': 'Intelligent Multilingual Task Management',
-                    'add_task': 'Add New Task',
-                    'task_title': 'Task Title',
-                    'task_description': 'Task Description', 
-                    'priority': 'Priority',
-                    'status': 'Status',
-                    'tags': 'Tags (comma-separated)',
-                    'create_task': 'Create Task',
-                    'update_task': 'Update Task',
-                    'delete_task': 'Delete Task',
-                    'translate': 'Translate',
-                    'language': 'Language',
-                    'filter_by_status': 'Filter by Status',
-                    'filter_by_priority': 'Filter by Priority',
-                    'search_tasks': 'Search Tasks',
-                    'no_tasks_found': 'No tasks found. Create your first task!',
-                    'translation_cached': 'Translation cached',
-                    'translation_from_gpt': 'Translated with AI',
-                    'translation_from_dict': 'Quick translation',
-                    'api_error': 'Translation service unavailable',
-                    'all': 'All'
-                },
-                'Spanish': {
-                    'app_title': 'App de Tareas IA',
-                    'app_subtitle': 'Gestión Inteligente de Tareas Multiidioma',
-                    'add_task': 'Agregar Nueva Tarea',
-                    'task_title': 'Título de la Tarea',
-                    'task_description': 'Descripción de la Tarea',
-                    'priority': 'Prioridad',
-                    'status': 'Estado',
-                    'tags': 'Etiquetas (separadas por comas)',
-                    'create_task': 'Crear Tarea',
-                    'update_task': 'Actualizar Tarea',
-                    'delete_task': 'Eliminar Tarea',
-                    'translate': 'Traducir',
-                    'language': 'Idioma',
-                    'filter_by_status': 'Filtrar por Estado',
-                    'filter_by_priority': 'Filtrar por Prioridad',
-                    'search_tasks': 'Buscar Tareas',
-                    'no_tasks_found': '¡No se encontraron tareas. Crea tu primera tarea!',
-                    'translation_cached': 'Traducción almacenada',
-                    'translation_from_gpt': 'Traducido con IA',
-                    'translation_from_dict': 'Traducción rápida',
-                    'api_error': 'Servicio de traducción no disponible',
-                    'all': 'Todos'
-                },
-                'French': {
-                    'app_title': 'App Todo IA',
-                    'app_subtitle': 'Gestion Intelligente de Tâches Multilingue',
-                    'add_task': 'Ajouter Nouvelle Tâche',
-                    'task_title': 'Titre de la Tâche',
-                    'task_description': 'Description de la Tâche',
-                    'priority': 'Priorité',
-                    'status': 'Statut',
-                    'tags': 'Étiquettes (séparées par virgules)',
-                    'create_task': 'Créer Tâche',
-                    'update_task': 'Mettre à Jour Tâche',
-                    'delete_task': 'Supprimer Tâche',
-                    'translate': 'Traduire',
-                    'language': 'Langue',
-                    'filter_by_status': 'Filtrer par Statut',
-                    'filter_by_priority': 'Filtrer par Priorité',
-                    'search_tasks': 'Rechercher Tâches',
-                    'no_tasks_found': 'Aucune tâche trouvée. Créez votre première tâche!',
-                    'translation_cached': 'Traduction mise en cache',
-                    'translation_from_gpt': 'Traduit avec IA',
-                    'translation_from_dict': 'Traduction rapide',
-                    'api_error': 'Service de traduction indisponible',
-                    'all': 'Tous'
-                },
-                'German': {
-                    'app_title': 'KI Todo App',
-                    'app_subtitle': 'Intelligente Mehrsprachige Aufgabenverwaltung',
-                    'add_task': 'Neue Aufgabe Hinzufügen',
-                    'task_title': 'Aufgabentitel',
-                    'task_description': 'Aufgabenbeschreibung',
-                    'priority': 'Priorität',
-                    'status': 'Status',
-                    'tags': 'Tags (durch Kommas getrennt)',
-                    'create_task': 'Aufgabe Erstellen',
-                    'update_task': 'Aufgabe Aktualisieren',
-                    'delete_task': 'Aufgabe Löschen',
-                    'translate': 'Übersetzen',
-                    'language': 'Sprache',
-                    'filter_by_status': 'Nach Status Filtern',
-                    'filter_by_priority': 'Nach Priorität Filtern',
-                    'search_tasks': 'Aufgaben Suchen',
-                    'no_tasks_found': 'Keine Aufgaben gefunden. Erstellen Sie Ihre erste Aufgabe!',
-                    'translation_cached': 'Übersetzung zwischengespeichert',
-                    'translation_from_gpt': 'Mit KI übersetzt',
-                    'translation_from_dict': 'Schnellübersetzung',
-                    'api_error': 'Übersetzungsdienst nicht verfügbar',
-                    'all': 'Alle'
-                },
-                'Italian': {
-                    'app_title': 'App Todo IA',
-                    'app_subtitle': 'Gestione Intelligente Attività Multilingue',
-                    'add_task': 'Aggiungi Nuova Attività',
-                    'task_title': 'Titolo Attività',
-                    'task_description': 'Descrizione Attività',
-                    'priority': 'Priorità',
-                    'status': 'Stato',
-                    'tags': 'Tag (separati da virgole)',
-                    'create_task': 'Crea Attività',
-                    'update_task': 'Aggiorna Attività',
-                    'delete_task': 'Elimina Attività',
-                    'translate': 'Traduci',
-                    'language': 'Lingua',
-                    'filter_by_status': 'Filtra per Stato',
-                    'filter_by_priority': 'Filtra per Priorità',
-                    'search_tasks': 'Cerca Attività',
-                    'no_tasks_found': 'Nessuna attività trovata. Crea la tua prima attività!',
-                    'translation_cached': 'Traduzione memorizzata',
-                    'translation_from_gpt': 'Tradotto con IA',
-                    'translation_from_dict': 'Traduzione veloce',
-                    'api_error': 'Servizio di traduzione non disponibile',
-                    'all': 'Tutti'
-                },
-                'Hindi': {
-                    'app_title': 'एआई टूडू ऐप',
-                    'app_subtitle': 'बुद्धिमान बहुभाषी कार्य प्रबंधन',
-                    'add_task': 'नया कार्य जोड़ें',
-                    'task_title': 'कार्य शीर्षक',
-                    'task_description': 'कार्य विवरण',
-                    'priority': 'प्राथमिकता',
-                    'status': 'स्थिति',
-                    'tags': 'टैग (कॉमा से अलग करें)',
-                    'create_task': 'कार्य बनाएं',
-                    'update_task': 'कार्य अपडेट करें',
-                    'delete_task': 'कार्य हटाएं',
-                    'translate': 'अनुवाद करें',
-                    'language': 'भाषा',
-                    'filter_by_status': 'स्थिति के अनुसार फ़िल्टर करें',
-                    'filter_by_priority': 'प्राथमिकता के अनुसार फ़िल्टर करें',
-                    'search_tasks': 'कार्य खोजें',
-                    'no_tasks_found': 'कोई कार्य नहीं मिला। अपना पहला कार्य बनाएं!',
-                    'translation_cached': 'अनुवाद संग्रहीत',
-                    'translation_from_gpt': 'एआई से अनुवादित',
-                    'translation_from_dict': 'त्वरित अनुवाद',
-                    'api_error': 'अनुवाद सेवा उपलब्ध नहीं',
-                    'all': 'सभी'
-                }
-            },
-            # Common task phrases
-            'tasks': {
-                'English': {
-                    'buy_groceries': 'Buy groceries',
-                    'call_doctor': 'Call doctor',
-                    'finish_project': 'Finish project',
-                    'pay_bills': 'Pay bills',
-                    'clean_house': 'Clean house',
-                    'exercise': 'Exercise',
-                    'study': 'Study',
-                    'meeting': 'Meeting',
-                    'deadline': 'Deadline',
-                    'urgent': 'Urgent',
-                    'important': 'Important',
-                    'work': 'Work',
-                    'personal': 'Personal',
-                    'health': 'Health',
-                    'finance': 'Finance',
-                    'shopping': 'Shopping',
-                    'appointment': 'Appointment'
-                },
-                'Spanish': {
-                    'buy_groceries': 'Comprar comestibles',
-                    'call_doctor': 'Llamar al doctor',
-                    'finish_project': 'Terminar proyecto',
-                    'pay_bills': 'Pagar facturas',
-                    'clean_house': 'Limpiar casa',
-                    'exercise': 'Hacer ejercicio',
-                    'study': 'Estudiar',
-                    'meeting': 'Reunión',
-                    'deadline': 'Fecha límite',
-                    'urgent': 'Urgente',
-                    'important': 'Importante',
-                    'work': 'Trabajo',
-                    'personal': 'Personal',
-                    'health': 'Salud',
-                    'finance': 'Finanzas',
-                    'shopping': 'Compras',
-                    'appointment': 'Cita'
-                },
-                'French': {
-                    'buy_groceries': 'Acheter des courses',
-                    'call_doctor': 'Appeler le docteur',
-                    'finish_project': 'Terminer le projet',
-                    'pay_bills': 'Payer les factures',
-                    'clean_house': 'Nettoyer la maison',
-                    'exercise': 'Faire de l\'exercice',
-                    'study': 'Étudier',
-                    'meeting': 'Réunion',
-                    'deadline': 'Date limite',
-                    'urgent': 'Urgent',
-                    'important': 'Important',
-                    'work': 'Travail',
-                    'personal': 'Personnel',
-                    'health': 'Santé',
-                    'finance': 'Finance',
-                    'shopping': 'Achats',
-                    'appointment': 'Rendez-vous'
-                },
-                'German': {
-                    'buy_groceries': 'Lebensmittel kaufen',
-                    'call_doctor': 'Arzt anrufen',
-                    'finish_project': 'Projekt beenden',
-                    'pay_bills': 'Rechnungen bezahlen',
-                    'clean_house': 'Haus putzen',
-                    'exercise': 'Sport treiben',
-                    'study': 'Lernen',
-                    'meeting': 'Besprechung',
-                    'deadline': 'Frist',
-                    'urgent': 'Dringend',
-                    'important': 'Wichtig',
-                    'work': 'Arbeit',
-                    'personal': 'Persönlich',
-                    'health': 'Gesundheit',
-                    'finance': 'Finanzen',
-                    'shopping': 'Einkaufen',
-                    'appointment': 'Termin'
-                },
-                'Italian': {
-                    'buy_groceries': 'Comprare generi alimentari',
-                    'call_doctor': 'Chiamare il dottore',
-                    'finish_project': 'Finire il progetto',
-                    'pay_bills': 'Pagare le bollette',
-                    'clean_house': 'Pulire casa',
-                    'exercise': 'Fare esercizio',
-                    'study': 'Studiare',
-                    'meeting': 'Riunione',
-                    'deadline': 'Scadenza',
-                    'urgent': 'Urgente',
-                    'important': 'Importante',
-                    'work': 'Lavoro',
-                    'personal': 'Personale',
-                    'health': 'Salute',
-                    'finance': 'Finanza',
-                    'shopping': 'Shopping',
-                    'appointment': 'Appuntamento'
-                },
-                'Hindi': {
-                    'buy_groceries': 'किराना खरीदना',
-                    'call_doctor': 'डॉक्टर को कॉल करना',
-                    'finish_project': 'प्रोजेक्ट पूरा करना',
-                    'pay_bills': 'बिल भुगतान',
-                    'clean_house': 'घर साफ करना',
-                    'exercise': 'व्यायाम',
-                    'study': 'अध्ययन',
-                    'meeting': 'बैठक',
-                    'deadline': 'समय सीमा',
-                    'urgent': 'तत्काल',
-                    'important': 'महत्वपूर्ण',
-                    'work': 'काम',
-                    'personal': 'व्यक्तिगत',
-                    'health': 'स्वास्थ्य',
-                    'finance': 'वित्त',
-                    'shopping': 'खरीदारी',
-                    'appointment': 'अपॉइंटमेंट'
-                }
-            }
-        }
-        
-        self.supported_languages = ['English', 'Spanish', 'French', 'German', 'Italian', 'Hindi']
-        
+        """Bind the module-level translation tables built at import time"""
+        self.predefined_translations = _PREDEFINED_TRANSLATIONS
+        self.supported_languages = _SUPPORTED_LANGUAGES
+        self._normalized_lookup = _NORMALIZED_LOOKUP
+        self._partial_items = _PARTIAL_ITEMS
+        self._ui_flat = _UI_FLAT
+
     def setup_openai_client(self):
-        """Initialize OpenAI client"""
-        self.openai_client = None
+        """Initialize OpenAI client from the shared client cache"""
         api_key = os.getenv('OPENAI_API_KEY')
-        
-        if not OPENAI_AVAILABLE:
+
+        if OPENAI_AVAILABLE and api_key and api_key.startswith('sk-'):
+            self.openai_client = get_openai_client(api_key)
             return
-            
-        if api_key and api_key.startswith('sk-'):
-            try:
-                self.openai_client = OpenAI(api_key=api_key)
-                # Test the connection with a minimal call
-                try:
-                    self.openai_client.models.list()
-                except Exception as test_error:
-                    st.warning(f"⚠️ OpenAI API test failed: {str(test_error)}")
-                    self.openai_client = None
-            except Exception as e:
-                st.error(f"OpenAI client initialization failed: {str(e)}")
-                self.openai_client = None
-        elif not api_key:
+
+        self.openai_client = None
+        if OPENAI_AVAILABLE and not api_key:
             # Only show this message once per session
             if 'api_key_warning_shown' not in st.session_state:
                 st.info("💡 Add OPENAI_API_KEY to environment variables for AI translations.")
@@ -371,96 +630,308 @@ class AITodoApp:
         """Get UI text in specified language"""
         if language is None:
             language = st.session_state.selected_language
-        return self.predefined_translations['ui'].get(language, {}).get(key, key)
+        return self._ui_flat.get((language, key), key)
     
+    @staticmethod
+    def _is_likely_language(text: str, language: str) -> bool:
+        """Cheap script heuristic: does the text already look like language?
+        Checks the Unicode script of the first few non-space characters;
+        only unambiguous scripts (Devanagari -> Hindi) ever return True
+        """
+        script = _LANGUAGE_SCRIPTS.get(language)
+        if not script:
+            return False
+
+        checked = 0
+        for ch in text:
+            if ch.isspace():
+                continue
+            if not unicodedata.name(ch, '').startswith(script):
+                return False
+            checked += 1
+            if checked >= 8:
+                break
+        return checked > 0
+
+    @staticmethod
+    def _normalize_key(text: str) -> str:
+        """Normalize text to the snake_case keys used by the dictionaries
+        casefold instead of lower so non-ASCII input normalizes correctly
+        """
+        return text.casefold().strip().translate(_NORMALIZE_TABLE)
+
     def translate_text_with_dictionary(self, text: str, target_language: str) -> Optional[str]:
         """First attempt: Check predefined dictionary"""
-        # Normalize text for lookup
-        normalized_text = text.lower().strip().replace(' ', '_').replace('.', '').replace(',', '').replace('!', '').replace('?', '')
-        
-        # Check UI translations
-        ui_translation = self.predefined_translations['ui'].get(target_language, {}).get(normalized_text)
-        if ui_translation:
-            return ui_translation
-            
-        # Check task translations
-        task_translation = self.predefined_translations['tasks'].get(target_language, {}).get(normalized_text)
-        if task_translation:
-            return task_translation
-            
-        # Check for partial matches in common words
-        for key, value in self.predefined_translations['tasks'].get(target_language, {}).items():
-            if normalized_text in key or key in normalized_text:
-                return value
-                
+        normalized_text = self._normalize_key(text)
+
+        # Exact match against the merged UI + task phrase index
+        translation = self._normalized_lookup.get(target_language, {}).get(normalized_text)
+        if translation:
+            return translation
+
+        # Partial matches: containment in either direction, so scan the
+        # full (small) task-phrase table
+        if normalized_text:
+            for key, value in self._partial_items.get(target_language, ()):
+                if normalized_text in key or key in normalized_text:
+                    return value
+
         return None
     
     def translate_text_with_gpt(self, text: str, target_language: str) -> str:
-        """Second attempt: Use GPT-4 for translation"""
-        if not self.openai_client:
-            return f"[Mock AI Translation to {target_language}] {text}"
+        """Second attempt: Use GPT-4 for translation
+        Requires a live client; API errors propagate so the shared cache
+        never stores a failed attempt as if it were a translation
+        """
+        # Handle translation to English specifically
+        if target_language == 'English':
+            system_prompt = "You are a professional translator. Translate the given text to English. Return only the English translation, no additional text or explanations."
+        else:
+            system_prompt = f"You are a professional translator. Translate the given text to {target_language}. Return only the translation, no additional text or explanations."
         
+        # Use GPT-4o-mini as specified in PRD
+        response = self.openai_client.chat.completions.create(
+            model="gpt-4o-mini-2024-07-18",
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": text
+                }
+            ],
+            max_tokens=150,
+            temperature=0.3
+        )
+        
+        st.session_state.api_usage_count += 1
+        return response.choices[0].message.content.strip()
+
+    def translate_texts(self, texts: List[str], target_language: str, context: str = "task") -> List[tuple[str, str]]:
+        """
+        Translate several texts at once: cache/dictionary per text, then the
+        shared GPT cache for whatever is still missing
+        Returns: list of (translated_text, translation_source) aligned with texts
+        """
+        results: List[Optional[tuple[str, str]]] = [None] * len(texts)
+        pending_indices = []
+
+        for i, text in enumerate(texts):
+            if not text.strip() or self._is_likely_language(text, target_language):
+                results[i] = (text, 'original')
+                continue
+
+            local_key = (text, target_language, context)
+            if local_key in self._request_local_cache:
+                results[i] = self._request_local_cache[local_key]
+                continue
+
+            cache_key = f"{text}_{target_language}_{context}"
+            if cache_key in st.session_state.translation_cache:
+                results[i] = (st.session_state.translation_cache[cache_key], 'cached')
+                self._request_local_cache[local_key] = results[i]
+                continue
+
+            dict_translation = self.translate_text_with_dictionary(text, target_language)
+            if dict_translation and dict_translation != text:
+                st.session_state.translation_cache[cache_key] = dict_translation
+                results[i] = (dict_translation, 'dictionary')
+                self._request_local_cache[local_key] = results[i]
+                continue
+
+            pending_indices.append(i)
+
+        if pending_indices:
+            # Duplicate texts ('urgent' tags, repeated titles) only get one
+            # GPT lookup each
+            unique_texts: Dict[str, None] = {}
+            for i in pending_indices:
+                unique_texts.setdefault(texts[i], None)
+
+            translated: Dict[str, tuple] = {}
+            for text in unique_texts:
+                if not self.openai_client:
+                    # Mock results stay session-local; the shared cache must
+                    # not serve placeholder strings to keyed sessions
+                    translated[text] = (f"[Mock AI Translation to {target_language}] {text}", 'gpt')
+                    continue
+                try:
+                    translated[text] = _cached_translate(self, text, target_language, context)
+                except Exception as e:
+                    # Uncached failure: this session falls back to the
+                    # original text, a later rerun or session retries
+                    st.error(f"GPT Translation Error: {str(e)}")
+                    translated[text] = (text, 'gpt')
+
+            for i in pending_indices:
+                translation, source = translated[texts[i]]
+                cache_key = f"{texts[i]}_{target_language}_{context}"
+                st.session_state.translation_cache[cache_key] = translation
+                results[i] = (translation, source)
+                self._request_local_cache[(texts[i], target_language, context)] = results[i]
+
+        return results
+
+    def submit_translation_batch(self, items: List[tuple]) -> Optional[str]:
+        """Submit bulk translations through the OpenAI Batch API
+        items: list of (task_id, field, text, target_language) tuples
+        """
+        if not self.openai_client:
+            st.warning("Batch translation requires a configured OpenAI API key.")
+            return None
+
         try:
-            # Handle translation to English specifically
-            if target_language == 'English':
-                system_prompt = "You are a professional translator. Translate the given text to English. Return only the English translation, no additional text or explanations."
-            else:
-                system_prompt = f"You are a professional translator. Translate the given text to {target_language}. Return only the translation, no additional text or explanations."
-            
-            # Use GPT-4o-mini as specified in PRD
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o-mini-2024-07-18",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user", 
-                        "content": text
+            lines = []
+            for task_id, field, text, lang in items:
+                request = {
+                    "custom_id": f"{task_id}|{field}|{lang}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": "gpt-4o-mini-2024-07-18",
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": f"You are a professional translator. Translate the given text to {lang}. Return only the translation, no additional text or explanations."
+                            },
+                            {
+                                "role": "user",
+                                "content": text
+                            }
+                        ],
+                        "max_tokens": 150,
+                        "temperature": 0.3
                     }
-                ],
-                max_tokens=150,
-                temperature=0.3
+                }
+                lines.append(json.dumps(request, ensure_ascii=False))
+
+            batch_file = self.openai_client.files.create(
+                file=("translations.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
             )
-            
-            st.session_state.api_usage_count += 1
-            return response.choices[0].message.content.strip()
-            
+            batch = self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            st.session_state.pending_batches.append(batch.id)
+            st.info(f"📤 Submitted {len(items)} translations as batch job. Use 'Check translations' to collect results.")
+            return batch.id
+
         except Exception as e:
-            st.error(f"GPT Translation Error: {str(e)}")
-            return text  # Return original text on error
-    
-    def translate_text(self, text: str, target_language: str, context: str = "task") -> tuple[str, str]:
-        """
-        Hybrid translation system: Dictionary first, then GPT fallback
-        Returns: (translated_text, translation_source)
+            st.error(f"Batch submission failed: {str(e)}")
+            return None
+
+    def check_translation_batches(self) -> None:
+        """Poll pending batch jobs and fold finished translations into tasks"""
+        if not self.openai_client or not st.session_state.pending_batches:
+            return
+
+        still_pending = []
+        for batch_id in st.session_state.pending_batches:
+            try:
+                batch = self.openai_client.batches.retrieve(batch_id)
+                if batch.status == 'completed' and batch.output_file_id:
+                    output = self.openai_client.files.content(batch.output_file_id)
+                    tasks_by_id = {task.id: task for task in st.session_state.tasks}
+                    applied = 0
+                    for line in output.text.splitlines():
+                        if not line.strip():
+                            continue
+                        result = json.loads(line)
+                        task_id, field, lang = result['custom_id'].split('|')
+                        task = tasks_by_id.get(task_id)
+                        if task is None or result.get('error'):
+                            continue
+                        translation = result['response']['body']['choices'][0]['message']['content'].strip()
+                        task.translations.setdefault(lang, {})[field] = translation
+                        applied += 1
+                    st.session_state.tasks_version += 1
+                    st.success(f"✅ Batch finished: {applied} translations applied.")
+                elif batch.status in ('failed', 'expired', 'cancelled'):
+                    st.error(f"❌ Translation batch {batch.status}.")
+                else:
+                    still_pending.append(batch_id)
+            except Exception as e:
+                st.error(f"Batch status check failed: {str(e)}")
+                still_pending.append(batch_id)
+
+        st.session_state.pending_batches = still_pending
+
+    def translate_all_tasks(self, tasks: List[Task], target_language: str) -> None:
+        """Translate every task that has no translation for target_language
+        Large jobs go through the Batch API; small ones stay synchronous
         """
-        if not text.strip():
-            return text, 'original'
-            
-        # If translating to the same conceptual language, return original
-        # But allow English -> English for consistency
-        
-        # Create cache key
-        cache_key = f"{text}_{target_language}_{context}"
-        
-        # Check cache first
-        if cache_key in st.session_state.translation_cache:
-            return st.session_state.translation_cache[cache_key], 'cached'
-        
-        # Step 1: Try predefined dictionary
-        dict_translation = self.translate_text_with_dictionary(text, target_language)
-        if dict_translation and dict_translation != text:
-            st.session_state.translation_cache[cache_key] = dict_translation
-            return dict_translation, 'dictionary'
-        
-        # Step 2: Use GPT-4 fallback (even for English)
-        gpt_translation = self.translate_text_with_gpt(text, target_language)
-        st.session_state.translation_cache[cache_key] = gpt_translation
-        return gpt_translation, 'gpt'
+        pending = [task for task in tasks if target_language not in task.translations]
+        if not pending:
+            st.info("All tasks are already translated.")
+            return
+
+        if len(pending) > 5 and self.openai_client:
+            items = []
+            for task in pending:
+                items.append((task.id, 'title', task.title, target_language))
+                if task.description:
+                    items.append((task.id, 'description', task.description, target_language))
+            self.submit_translation_batch(items)
+            return
+
+        # Each call is dominated by network latency, so fan the tasks out
+        # across threads; max_workers doubles as a crude rate limit. Workers
+        # need the script-run context attached to touch session state.
+        ctx = get_script_run_ctx()
+
+        def translate_one(task):
+            add_script_run_ctx(ctx=ctx)
+            return self.translate_texts([task.title, task.description], target_language)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for task, result in zip(pending, executor.map(translate_one, pending)):
+                (translated_title, _), (translated_desc, _) = result
+                task.translations[target_language] = {
+                    'title': translated_title,
+                    'description': translated_desc
+                }
+        st.session_state.tasks_version += 1
+
+
+    @staticmethod
+    def _task_search_text(task: Task) -> str:
+        """Pre-lowercased searchable blob for a task (title, description, tags)"""
+        return "\x01".join([task.title, task.description, *task.tags]).casefold()
+
+    def _append_task_cols(self, task: Task) -> None:
+        """Keep the columnar filter store in sync when a task is added"""
+        st.session_state.tasks_version += 1
+        cols = st.session_state.task_cols
+        st.session_state.task_index[task.id] = len(cols['id'])
+        cols['id'].append(task.id)
+        cols['search'].append(self._task_search_text(task))
+        cols['status'].append(task.status)
+        cols['priority'].append(task.priority)
+
+    def _refresh_task_cols(self, index: int, task: Task) -> None:
+        """Refresh one row of the columnar filter store after an edit"""
+        st.session_state.tasks_version += 1
+        cols = st.session_state.task_cols
+        cols['search'][index] = self._task_search_text(task)
+        cols['status'][index] = task.status
+        cols['priority'][index] = task.priority
+
+    def _rebuild_task_cols(self) -> None:
+        """Rebuild the columnar filter store from the tasks list"""
+        st.session_state.tasks_version += 1
+        tasks = st.session_state.tasks
+        st.session_state.task_cols = {
+            'id': [task.id for task in tasks],
+            'search': [self._task_search_text(task) for task in tasks],
+            'status': [task.status for task in tasks],
+            'priority': [task.priority for task in tasks]
+        }
+        st.session_state.task_index = {task.id: i for i, task in enumerate(tasks)}
 
-    
     def create_task(self, title: str, description: str, priority: str, tags: List[str] = None) -> None:
         """Create a new task"""
         task = Task(
@@ -468,51 +939,81 @@ class AITodoApp:
             title=title,
             description=description,
             priority=priority,
-            status=Status.TODO.value,
+            status=_STATUS_TODO,
             created_at=datetime.datetime.now().isoformat(),
             tags=tags or []
         )
         st.session_state.tasks.append(task)
+        self._append_task_cols(task)
         st.success("✅ Task created successfully!")
-    
+
     def update_task(self, task_id: str, **kwargs) -> None:
         """Update an existing task"""
-        for i, task in enumerate(st.session_state.tasks):
-            if task.id == task_id:
-                for key, value in kwargs.items():
-                    if hasattr(task, key):
-                        setattr(task, key, value)
-                st.session_state.tasks[i] = task
-                break
-    
+        i = st.session_state.task_index.get(task_id)
+        if i is None:
+            return
+        task = st.session_state.tasks[i]
+        for key, value in kwargs.items():
+            if hasattr(task, key):
+                setattr(task, key, value)
+        # setattr mutated the listed object in place; writing it back into
+        # session state would only trigger extra change tracking
+        self._refresh_task_cols(i, task)
+
     def delete_task(self, task_id: str) -> None:
         """Delete a task"""
-        st.session_state.tasks = [task for task in st.session_state.tasks if task.id != task_id]
+        i = st.session_state.task_index.pop(task_id, None)
+        if i is None:
+            return
+        tasks = st.session_state.tasks
+        del tasks[i]
+        for column in st.session_state.task_cols.values():
+            del column[i]
+        # Only the tail that shifted down needs reindexing
+        task_index = st.session_state.task_index
+        for j in range(i, len(tasks)):
+            task_index[tasks[j].id] = j
+        st.session_state.tasks_version += 1
         st.success("🗑️ Task deleted successfully!")
-    
+
     def get_filtered_tasks(self, search_query: str = "", status_filter: str = "All", priority_filter: str = "All") -> List[Task]:
         """Filter tasks based on search and filters"""
-        tasks = st.session_state.tasks.copy()
-        
-        # Search filter
-        if search_query:
-            search_lower = search_query.lower()
-            tasks = [
-                task for task in tasks
-                if search_lower in task.title.lower() 
-                or search_lower in task.description.lower()
-                or any(search_lower in tag.lower() for tag in task.tags)
-            ]
-        
-        # Status filter
-        if status_filter != "All":
-            tasks = [task for task in tasks if task.status == status_filter]
-        
-        # Priority filter  
-        if priority_filter != "All":
-            tasks = [task for task in tasks if task.priority == priority_filter]
-        
-        return tasks
+        # Read-only reference; the filter loop below builds its own list
+        tasks = st.session_state.tasks
+
+        # Reruns triggered by unrelated widgets reuse the previous result
+        filter_key = (search_query, status_filter, priority_filter,
+                      len(tasks), st.session_state.tasks_version)
+        if st.session_state.get('_last_filter_key') == filter_key:
+            return st.session_state._last_filter_result
+
+        cols = st.session_state.task_cols
+        if len(cols['id']) != len(tasks):
+            # Session predates the columnar store (or drifted); resync once
+            self._rebuild_task_cols()
+            cols = st.session_state.task_cols
+
+        # One compiled matcher per query instead of a .lower() per field
+        search_pattern = re.compile(re.escape(search_query.casefold())) if search_query else None
+        search_col = cols['search']
+        status_col = cols['status']
+        priority_col = cols['priority']
+
+        # Cheapest predicates first: the string equalities prune the set
+        # before the (comparatively pricey) substring search runs
+        filtered = []
+        for i, task in enumerate(tasks):
+            if status_filter != "All" and status_col[i] != status_filter:
+                continue
+            if priority_filter != "All" and priority_col[i] != priority_filter:
+                continue
+            if search_pattern and not search_pattern.search(search_col[i]):
+                continue
+            filtered.append(task)
+
+        st.session_state._last_filter_key = filter_key
+        st.session_state._last_filter_result = filtered
+        return filtered
     
     def render_header(self):
         """Render app header with language selection"""
@@ -549,7 +1050,7 @@ class AITodoApp:
             with col1:
                 priority = st.selectbox(
                     self.get_ui_text('priority'),
-                    [p.value for p in Priority]
+                    PRIORITY_VALUES
                 )
             
             with col2:
@@ -571,6 +1072,8 @@ class AITodoApp:
         """Render search and filter controls"""
         st.subheader(f"🔍 {self.get_ui_text('search_tasks')}")
         
+        # Resolve the localized "All" label once for both selectboxes
+        all_label = self.get_ui_text('all')
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -583,19 +1086,34 @@ class AITodoApp:
         with col2:
             status_filter = st.selectbox(
                 self.get_ui_text('filter_by_status'),
-                [self.get_ui_text('all')] + [s.value for s in Status],
+                [all_label] + list(STATUS_VALUES),
                 key="status_filter"
             )
         
         with col3:
             priority_filter = st.selectbox(
                 self.get_ui_text('filter_by_priority'),
-                [self.get_ui_text('all')] + [p.value for p in Priority],
+                [all_label] + list(PRIORITY_VALUES),
                 key="priority_filter"
             )
         
         return search_query, status_filter, priority_filter
-    
+
+    def render_bulk_translation_controls(self):
+        """Render translate-all and batch polling controls"""
+        current_lang = st.session_state.selected_language
+
+        col1, col2 = st.columns([2, 2])
+        with col1:
+            if st.session_state.tasks and st.button(f"🌐 Translate all to {current_lang}", key="translate_all"):
+                self.translate_all_tasks(st.session_state.tasks, current_lang)
+                self.safe_rerun()
+        with col2:
+            pending = len(st.session_state.pending_batches)
+            if pending and st.button(f"📥 Check translations ({pending} pending)", key="check_batches"):
+                self.check_translation_batches()
+                self.safe_rerun()
+
     def safe_rerun(self):
         """Safely call rerun for different Streamlit versions"""
         try:
@@ -608,10 +1126,11 @@ class AITodoApp:
         current_lang = st.session_state.selected_language
         
         # Determine what to display based on current language
-        if current_lang in task.translations:
+        translation = task.translations.get(current_lang)
+        if translation is not None:
             # Show translated version if available
-            display_title = task.translations[current_lang].get('title', task.title)
-            display_description = task.translations[current_lang].get('description', task.description)
+            display_title = translation.get('title', task.title)
+            display_description = translation.get('description', task.description)
             is_translated = True
             show_original = True
         else:
@@ -647,8 +1166,8 @@ class AITodoApp:
                 # Status selector
                 new_status = st.selectbox(
                     self.get_ui_text('status'),
-                    [s.value for s in Status],
-                    index=[s.value for s in Status].index(task.status),
+                    STATUS_VALUES,
+                    index=STATUS_INDEX[task.status],
                     key=f"status_{task.id}"
                 )
                 if new_status != task.status:
@@ -674,29 +1193,28 @@ class AITodoApp:
                     translate_label = f"🌐 Translate to {current_lang}" if current_lang != 'English' else "🌐 Translate to English"
                     if st.button(translate_label, key=f"translate_{task.id}"):
                         with st.spinner(f"Translating to {current_lang}..."):
-                            # Translate title and description
-                            translated_title, source_title = self.translate_text(task.title, current_lang, "title")
-                            translated_desc, source_desc = self.translate_text(task.description, current_lang, "description")
-                            
+                            # Translate title and description in one API round-trip
+                            (translated_title, source_title), (translated_desc, source_desc) = \
+                                self.translate_texts([task.title, task.description], current_lang)
+
                             # Store translation
-                            if current_lang not in task.translations:
-                                task.translations[current_lang] = {}
-                            task.translations[current_lang]['title'] = translated_title
-                            task.translations[current_lang]['description'] = translated_desc
+                            entry = task.translations.setdefault(current_lang, {})
+                            entry['title'] = translated_title
+                            entry['description'] = translated_desc
                             
-                            # Update task in session state
-                            for i, t in enumerate(st.session_state.tasks):
-                                if t.id == task.id:
-                                    st.session_state.tasks[i] = task
-                                    break
+                            # Update task in session state via the id index
+                            i = st.session_state.task_index.get(task.id)
+                            if i is not None:
+                                st.session_state.tasks[i] = task
+                            st.session_state.tasks_version += 1
                         
                         self.safe_rerun()
                 else:
                     # Show retranslate option
                     if st.button(f"🔄 Retranslate", key=f"retranslate_{task.id}"):
                         # Clear existing translation and retranslate
-                        if current_lang in task.translations:
-                            del task.translations[current_lang]
+                        if task.translations.pop(current_lang, None) is not None:
+                            st.session_state.tasks_version += 1
                         self.safe_rerun()
             
             with col2:
@@ -709,41 +1227,58 @@ class AITodoApp:
             st.info(self.get_ui_text('no_tasks_found'))
             return
         
-        # Sort tasks: Todo -> In Progress -> Completed, then by priority
-        priority_order = {Priority.HIGH.value: 0, Priority.MEDIUM.value: 1, Priority.LOW.value: 2}
-        status_order = {Status.TODO.value: 0, Status.IN_PROGRESS.value: 1, Status.COMPLETED.value: 2}
-        
-        sorted_tasks = sorted(
-            filtered_tasks,
-            key=lambda t: (status_order.get(t.status, 3), priority_order.get(t.priority, 3))
-        )
+        # Sort tasks: Todo -> In Progress -> Completed, then by priority;
+        # decorate-sort-undecorate so the key is computed once per task and
+        # the sort itself compares plain tuples without a lambda call.
+        # Every stored task has a known status/priority, so subscript the
+        # key table directly and treat a miss as the exception it is
+        decorated = []
+        for i, t in enumerate(filtered_tasks):
+            try:
+                key = _TASK_SORT_KEY[(t.status, t.priority)]
+            except KeyError:
+                key = 0xFF  # malformed entry sorts last
+            decorated.append((key, i))
+        decorated.sort()
+        sorted_tasks = [filtered_tasks[i] for _, i in decorated]
         
         for task in sorted_tasks:
             self.render_task_card(task)
     
+    def _compute_task_stats(self) -> SimpleNamespace:
+        """One aggregation pass shared by the sidebar and the analytics tab
+        Served from st.cache_data while the task list is unchanged
+        """
+        return _aggregate_task_stats(
+            st.session_state.session_token,
+            st.session_state.tasks_version,
+            st.session_state.tasks
+        )
+
     def render_statistics(self):
         """Render app statistics in sidebar"""
         st.sidebar.markdown("### 📊 Statistics")
-        
-        total_tasks = len(st.session_state.tasks)
-        completed_tasks = len([t for t in st.session_state.tasks if t.status == Status.COMPLETED.value])
-        
+
+        stats = self._stats
+        total_tasks = stats.total
+        priority_counts = stats.priority
+        completed_tasks = stats.status[_STATUS_COMPLETED]
+
         if total_tasks > 0:
             completion_rate = (completed_tasks / total_tasks) * 100
             st.sidebar.metric("Completion Rate", f"{completion_rate:.1f}%")
             st.sidebar.metric("Total Tasks", total_tasks)
             st.sidebar.metric("Completed", completed_tasks)
             st.sidebar.metric("Remaining", total_tasks - completed_tasks)
-            
-            # Priority breakdown
-            high_priority = len([t for t in st.session_state.tasks if t.priority == Priority.HIGH.value])
-            medium_priority = len([t for t in st.session_state.tasks if t.priority == Priority.MEDIUM.value])
-            low_priority = len([t for t in st.session_state.tasks if t.priority == Priority.LOW.value])
-            
-            st.sidebar.markdown("**Priority Breakdown:**")
-            st.sidebar.write(f"🔴 High: {high_priority}")
-            st.sidebar.write(f"🟡 Medium: {medium_priority}") 
-            st.sidebar.write(f"🟢 Low: {low_priority}")
+
+            # One markdown element instead of four write calls; each st.*
+            # call is its own message to the frontend
+            st.sidebar.markdown(
+                "**Priority Breakdown:**\n\n"
+                f"🔴 High: {priority_counts[_PRIORITY_HIGH]}\n\n"
+                f"🟡 Medium: {priority_counts[_PRIORITY_MEDIUM]}\n\n"
+                f"🟢 Low: {priority_counts[_PRIORITY_LOW]}"
+            )
         else:
             st.sidebar.metric("Total Tasks", 0)
         
@@ -752,92 +1287,75 @@ class AITodoApp:
         st.sidebar.metric("API Calls Made", st.session_state.api_usage_count)
         st.sidebar.metric("Cached Translations", len(st.session_state.translation_cache))
         
-        # Quick actions
-        st.sidebar.markdown("### ⚡ Quick Actions")
-        if st.sidebar.button("🗑️ Clear All Tasks"):
+        # Quick actions run in their own fragment so a button click does
+        # not re-execute the whole script; st.sidebar is not allowed inside
+        # a fragment body, so render the fragment from a sidebar container
+        with st.sidebar:
+            self._sidebar_quick_actions()
+
+    @st.fragment
+    def _sidebar_quick_actions(self):
+        """Sidebar quick-action buttons, scoped to a fragment rerun
+        Runs inside a with st.sidebar block, hence the bare st.* calls
+        """
+        st.markdown("### ⚡ Quick Actions")
+        if st.button("🗑️ Clear All Tasks"):
             st.session_state.tasks = []
-            st.rerun()
+            self._rebuild_task_cols()
+            # The tasks list lives outside this fragment, so this one
+            # action still needs a full-script rerun
+            st.rerun(scope="app")
         
-        if st.sidebar.button("🧹 Clear Translation Cache"):
+        if st.button("🧹 Clear Translation Cache"):
             st.session_state.translation_cache = {}
-            st.sidebar.success("Cache cleared!")
+            _cached_translate.clear()
+            st.success("Cache cleared!")
     
     def add_sample_tasks(self):
         """Add sample tasks for demonstration"""
-        sample_tasks = [
-            {
-                'title': 'Buy groceries',
-                'description': 'Get milk, bread, eggs and vegetables from the supermarket',
-                'priority': Priority.MEDIUM.value,
-                'tags': ['shopping', 'food', 'weekly']
-            },
-            {
-                'title': 'Finish project report',
-                'description': 'Complete the quarterly project analysis and submit to manager',
-                'priority': Priority.HIGH.value,
-                'tags': ['work', 'deadline', 'important']
-            },
-            {
-                'title': 'Call doctor for appointment',
-                'description': 'Schedule annual health checkup with family doctor',
-                'priority': Priority.LOW.value,
-                'tags': ['health', 'appointment', 'personal']
-            },
-            {
-                'title': 'Pay monthly bills',
-                'description': 'Pay electricity, water, internet and phone bills before due date',
-                'priority': Priority.MEDIUM.value,
-                'tags': ['finance', 'bills', 'monthly']
-            },
-            {
-                'title': 'Exercise routine',
-                'description': '30 minutes cardio workout at home or gym',
-                'priority': Priority.LOW.value,
-                'tags': ['health', 'fitness', 'daily']
-            }
-        ]
-        
-        for task_data in sample_tasks:
+        for task_data in _SAMPLE_TASKS:
             self.create_task(
                 title=task_data['title'],
                 description=task_data['description'],
                 priority=task_data['priority'],
-                tags=task_data['tags']
+                tags=list(task_data['tags'])
             )
     
     def export_tasks_json(self) -> str:
         """Export all tasks to JSON format"""
-        tasks_data = []
-        for task in st.session_state.tasks:
-            task_dict = asdict(task)
-            tasks_data.append(task_dict)
-        
-        return json.dumps(tasks_data, indent=2, ensure_ascii=False)
+        return _export_tasks_json_cached(
+            st.session_state.session_token,
+            st.session_state.tasks_version,
+            st.session_state.tasks
+        )
     
     def import_tasks_json(self, json_data: str) -> bool:
         """Import tasks from JSON data"""
         try:
-            tasks_data = json.loads(json_data)
-            imported_count = 0
-            
-            for task_data in tasks_data:
-                # Create task object
-                task = Task(
-                    id=task_data.get('id', str(uuid.uuid4())),
-                    title=task_data['title'],
-                    description=task_data['description'],
-                    priority=task_data['priority'],
-                    status=task_data['status'],
-                    created_at=task_data['created_at'],
-                    tags=task_data.get('tags', []),
-                    translations=task_data.get('translations', {})
-                )
-                st.session_state.tasks.append(task)
-                imported_count += 1
-            
-            st.success(f"✅ Successfully imported {imported_count} tasks!")
+            if IJSON_AVAILABLE and len(json_data) > _IMPORT_STREAM_THRESHOLD:
+                tasks_data = ijson.items(io.StringIO(json_data), 'item')
+            else:
+                tasks_data = json.loads(json_data)
+
+            new_tasks = [Task.from_dict(task_data) for task_data in tasks_data]
+
+            # Re-importing an export while the originals are still present
+            # would duplicate ids, and the id -> index map needs them to be
+            # unique for edits/deletes to resolve; duplicates get fresh ids
+            seen = set(st.session_state.task_index)
+            for task in new_tasks:
+                if task.id in seen:
+                    task.id = str(uuid.uuid4())
+                seen.add(task.id)
+
+            # One bulk extend and one index rebuild instead of a
+            # session-state mutation per imported task
+            st.session_state.tasks.extend(new_tasks)
+            self._rebuild_task_cols()
+
+            st.success(f"✅ Successfully imported {len(new_tasks)} tasks!")
             return True
-            
+
         except Exception as e:
             st.error(f"❌ Import failed: {str(e)}")
             return False
@@ -853,29 +1371,11 @@ class AITodoApp:
         )
         
         # Custom CSS for better styling
-        st.markdown("""
-        <style>
-        .stApp {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        .task-card {
-            border: 1px solid #e0e0e0;
-            border-radius: 10px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-            background-color: #fafafa;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .metric-card {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 8px;
-            text-align: center;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CSS, unsafe_allow_html=True)
         
+        # Aggregate task statistics once per rerun for all renderers
+        self._stats = self._compute_task_stats()
+
         # Render sidebar statistics and quick actions
         self.render_statistics()
         
@@ -900,7 +1400,8 @@ class AITodoApp:
             # Show recent tasks preview
             if st.session_state.tasks:
                 st.markdown("### 👀 Recent Tasks Preview")
-                recent_tasks = sorted(st.session_state.tasks, key=lambda x: x.created_at, reverse=True)[:3]
+                # Top-3 selection without sorting the whole list
+                recent_tasks = heapq.nlargest(3, st.session_state.tasks, key=attrgetter('created_at'))
                 for task in recent_tasks:
                     with st.expander(f"{task.priority} {task.title}"):
                         st.write(f"**Description:** {task.description}")
@@ -910,11 +1411,13 @@ class AITodoApp:
         
         with tab2:
             search_query, status_filter, priority_filter = self.render_task_filters()
-            
+            self.render_bulk_translation_controls()
+
             # Convert "All" back to English for filtering logic
-            if status_filter == self.get_ui_text('all'):
+            all_label = self.get_ui_text('all')
+            if status_filter == all_label:
                 status_filter = "All"
-            if priority_filter == self.get_ui_text('all'):
+            if priority_filter == all_label:
                 priority_filter = "All"
             
             filtered_tasks = self.get_filtered_tasks(search_query, status_filter, priority_filter)
@@ -948,11 +1451,14 @@ class AITodoApp:
             st.info("No tasks available for analytics. Create some tasks first!")
             return
         
-        # Key metrics
-        total_tasks = len(st.session_state.tasks)
-        completed_tasks = len([t for t in st.session_state.tasks if t.status == Status.COMPLETED.value])
-        in_progress_tasks = len([t for t in st.session_state.tasks if t.status == Status.IN_PROGRESS.value])
-        todo_tasks = len([t for t in st.session_state.tasks if t.status == Status.TODO.value])
+        # Key metrics come from the shared aggregation pass done in run()
+        stats = self._stats
+        total_tasks = stats.total
+        priority_counts = stats.priority
+        translated_tasks = stats.translated
+        completed_tasks = stats.status[_STATUS_COMPLETED]
+        in_progress_tasks = stats.status[_STATUS_IN_PROGRESS]
+        todo_tasks = stats.status[_STATUS_TODO]
         
         # Metrics row
         col1, col2, col3, col4 = st.columns(4)
@@ -971,32 +1477,30 @@ class AITodoApp:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("#### 🎯 Priority Breakdown")
-            high_priority = len([t for t in st.session_state.tasks if t.priority == Priority.HIGH.value])
-            medium_priority = len([t for t in st.session_state.tasks if t.priority == Priority.MEDIUM.value])
-            low_priority = len([t for t in st.session_state.tasks if t.priority == Priority.LOW.value])
-            
             priority_data = {
-                "🔴 High": high_priority,
-                "🟡 Medium": medium_priority,
-                "🟢 Low": low_priority
+                "🔴 High": priority_counts[_PRIORITY_HIGH],
+                "🟡 Medium": priority_counts[_PRIORITY_MEDIUM],
+                "🟢 Low": priority_counts[_PRIORITY_LOW]
             }
-            
+            # Compose the breakdown into a single element per column
+            lines = ["#### 🎯 Priority Breakdown"]
             for priority, count in priority_data.items():
                 percentage = (count / total_tasks * 100) if total_tasks > 0 else 0
-                st.write(f"{priority}: {count} ({percentage:.1f}%)")
+                lines.append(f"{priority}: {count} ({percentage:.1f}%)")
+            st.markdown("\n\n".join(lines))
         
         with col2:
-            st.markdown("#### 📊 Status Breakdown") 
             status_data = {
                 "📝 Todo": todo_tasks,
                 "⏳ In Progress": in_progress_tasks,
                 "✅ Completed": completed_tasks
             }
             
+            lines = ["#### 📊 Status Breakdown"]
             for status, count in status_data.items():
                 percentage = (count / total_tasks * 100) if total_tasks > 0 else 0
-                st.write(f"{status}: {count} ({percentage:.1f}%)")
+                lines.append(f"{status}: {count} ({percentage:.1f}%)")
+            st.markdown("\n\n".join(lines))
         
         # Translation statistics
         st.markdown("#### 🌐 Translation Statistics")
@@ -1007,22 +1511,14 @@ class AITodoApp:
         with col2:
             st.metric("💾 Cached Translations", len(st.session_state.translation_cache))
         with col3:
-            translated_tasks = len([t for t in st.session_state.tasks if t.translations])
             st.metric("🌍 Translated Tasks", translated_tasks)
         
-        # Most used tags
-        if any(task.tags for task in st.session_state.tasks):
+        # Most used tags, already tallied in the shared stats pass; a
+        # separate any-tags probe would just walk the list again
+        if stats.tags:
             st.markdown("#### 🏷️ Popular Tags")
-            all_tags = []
-            for task in st.session_state.tasks:
-                all_tags.extend(task.tags)
-            
-            from collections import Counter
-            tag_counts = Counter(all_tags)
-            
-            if tag_counts:
-                for tag, count in tag_counts.most_common(5):
-                    st.write(f"`{tag}`: {count} tasks")
+            for tag, count in stats.tags.most_common(5):
+                st.write(f"`{tag}`: {count} tasks")
 
 # Main application execution
 def main():